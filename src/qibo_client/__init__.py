@@ -5,4 +5,4 @@ import importlib.metadata as im
 __version__ = im.version(__package__)
 
 from .qibo_client import Client
-from .qibo_job import QiboJob, QiboJobStatus
+from .qibo_job import QiboJob, QiboJobStatus, gather_results
@@ -0,0 +1,82 @@
+"""This module implements the local cache of the executed circuits"""
+
+import hashlib
+import json
+import typing as T
+from pathlib import Path
+
+from . import constants
+
+
+class QiboCircuitCache:
+    """Local cache mapping circuit executions to the pid of the job that ran them.
+
+    Each entry is stored as a file under `RESULTS_BASE_FOLDER/cache`, named
+    after the hash of the execution and containing the job pid.
+    """
+
+    def __init__(self, folder: T.Optional[Path] = None):
+        """
+        :param folder: the cache folder, defaults to `RESULTS_BASE_FOLDER/cache`
+        :type folder: Optional[Path]
+        """
+        if folder is None:
+            folder = constants.RESULTS_BASE_FOLDER / "cache"
+        self.folder = folder
+
+    @staticmethod
+    def key(
+        circuit: str,
+        nshots: T.Optional[int],
+        device: str,
+        verbatim: bool = False,
+    ) -> str:
+        """Compute the cache key of a circuit execution.
+
+        :param circuit: the QASM representation of the circuit
+        :type circuit: str
+        :param nshots: number of shots
+        :type nshots: Optional[int]
+        :param device: the device the circuit runs on
+        :type device: str
+        :param verbatim: whether the circuit runs without transpilation
+        :type verbatim: bool
+
+        :return: the SHA-256 hex digest identifying the execution
+        :rtype: str
+        """
+        payload = json.dumps([circuit, nshots, device, verbatim])
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> T.Optional[str]:
+        """Return the pid of the job cached under `key`.
+
+        An entry is considered valid only if the job results have already been
+        downloaded to `RESULTS_BASE_FOLDER`.
+
+        :param key: the cache key
+        :type key: str
+
+        :return: the cached job pid, None if not found
+        :rtype: Optional[str]
+        """
+        entry = self.folder / key
+        if not entry.is_file():
+            return None
+
+        pid = entry.read_text()
+        results_path = constants.RESULTS_BASE_FOLDER / pid / "results.npy"
+        if not results_path.is_file():
+            return None
+        return pid
+
+    def set(self, key: str, pid: str):
+        """Store the job pid under `key`.
+
+        :param key: the cache key
+        :type key: str
+        :param pid: the job's process identifier
+        :type pid: str
+        """
+        self.folder.mkdir(parents=True, exist_ok=True)
+        (self.folder / key).write_text(pid)
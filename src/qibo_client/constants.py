@@ -2,7 +2,36 @@ import os
 from pathlib import Path
 
 RESULTS_BASE_FOLDER = Path(os.environ.get("RESULTS_BASE_FOLDER", "/tmp/qibo_client"))
-SECONDS_BETWEEN_CHECKS = os.environ.get("SECONDS_BETWEEN_CHECKS", 2)
+SECONDS_BETWEEN_CHECKS = float(os.environ.get("SECONDS_BETWEEN_CHECKS", 2))
+# the polling interval starts from this value and grows up to
+# `SECONDS_BETWEEN_CHECKS` by `BACKOFF_FACTOR` at every check
+MIN_SECONDS_BETWEEN_CHECKS = 0.1
+BACKOFF_FACTOR = 1.8
+# seconds for which the job status is reused before querying the server again
+STATUS_CACHE_TTL = 0.5
 
 BASE_URL = "https://cloud.qibo.science"
 TIMEOUT = 60
+# fraction of `TIMEOUT` the server is asked to hold a long polling request for,
+# so that it answers before the client gives up on it
+LONG_POLL_TIMEOUT_RATIO = 0.9
+
+# size of the buffer used to read the results archive from the response
+RESPONSE_BUFSIZE = 1024 * 1024
+# buffer sizes used when unpacking the results archive, the stream one must be
+# a multiple of `tarfile.BLOCKSIZE`
+TAR_STREAM_BUFSIZE = 512 * 1024
+TAR_COPY_BUFSIZE = 2 * 1024 * 1024
+# size of the chunks decompressed in parallel by `rapidgzip`, when installed
+RAPIDGZIP_CHUNK_SIZE = 4 * 1024 * 1024
+# archives downloaded in memory of at least this size (in bytes) are
+# decompressed by `rapidgzip`, when installed
+RAPIDGZIP_MIN_SIZE = int(os.environ.get("RAPIDGZIP_MIN_SIZE", 16 * 1024 * 1024))
+# bounds the memory used to decompress zstd-compressed results archives
+ZSTD_MAX_WINDOW_SIZE = 2**27
+# archives smaller than this size (in bytes) are downloaded in memory before
+# being unpacked, the ones of at least `NATIVE_TAR_MIN_SIZE` by the system `tar`
+IN_MEMORY_ARCHIVE_MAX_SIZE = int(
+    os.environ.get("IN_MEMORY_ARCHIVE_MAX_SIZE", 64 * 1024 * 1024)
+)
+NATIVE_TAR_MIN_SIZE = int(os.environ.get("NATIVE_TAR_MIN_SIZE", 64 * 1024 * 1024))
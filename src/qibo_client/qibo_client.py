@@ -1,5 +1,6 @@
 """The module implementing the Client class."""
 
+import threading
 import typing as T
 
 import dateutil
@@ -8,10 +9,15 @@ import tabulate
 from packaging.version import Version
 
 from . import constants
+from .cache import QiboCircuitCache
 from .config_logging import logger
 from .exceptions import JobPostServerError
 from .qibo_job import QiboJob
-from .utils import QiboApiRequest
+from .utils import QiboApiRequest, new_session
+
+# (server url, local qibo version) pairs already checked in this process
+_checked_qibo_versions: T.Set[T.Tuple[str, str]] = set()
+_checked_qibo_versions_lock = threading.Lock()
 
 
 class Client:
@@ -27,6 +33,7 @@ class Client:
         self.token = token
         self.headers = {"x-api-token": token}
         self.base_url = url
+        self._session = new_session(self.headers)
 
         self.pid = None
         self.results_folder = None
@@ -36,11 +43,23 @@ class Client:
         """Check that client and server qibo package installed versions match.
 
         Raise assertion error if the two versions are not the same.
+
+        The check is performed only once per server and local qibo version in
+        the same process.
         """
+        key = (self.base_url, qibo.__version__)
+        with _checked_qibo_versions_lock:
+            if key in _checked_qibo_versions:
+                return
+            self._check_client_server_qibo_versions()
+            _checked_qibo_versions.add(key)
+
+    def _check_client_server_qibo_versions(self):
         url = self.base_url + "/api/qibo_version/"
         response = QiboApiRequest.get(
             url,
             timeout=constants.TIMEOUT,
+            session=self._session,
             keys_to_check=["server_qibo_version", "minimum_client_qibo_version"],
         )
 
@@ -72,6 +91,7 @@ class Client:
         project: str = "personal",
         nshots: T.Optional[int] = None,
         verbatim: bool = False,
+        use_cache: bool = False,
     ) -> T.Optional[
         T.Union[
             qibo.result.QuantumState,
@@ -91,6 +111,8 @@ class Client:
         :type nshots: int
         :param verbatim: If True, attempts to run the circuit without any transpilation. Defaults to False.
         :type verbatim: bool
+        :param use_cache: If True, reuses the downloaded results of a previous job running the same circuit with the same settings, if any. Defaults to False.
+        :type use_cache: bool
         :param wait_for_results: whether to let the client hang until server results are ready or not. Defaults to True.
         :type wait_for_results: bool
 
@@ -99,10 +121,29 @@ class Client:
             raised an error.
         :rtype: Optional[QiboJobResult]
         """
+        if use_cache:
+            cache = QiboCircuitCache()
+            key = cache.key(circuit.raw, nshots, device, verbatim)
+            self.pid = cache.get(key)
+            if self.pid is not None:
+                logger.info("Circuit found in cache, reusing job with pid %s", self.pid)
+                return QiboJob(
+                    base_url=self.base_url,
+                    headers=self.headers,
+                    session=self._session,
+                    pid=self.pid,
+                    circuit=circuit.raw,
+                    nshots=nshots,
+                    device=device,
+                )
+
         self.check_client_server_qibo_versions()
         logger.info("Post new circuit on the server")
         job = self._post_circuit(circuit, device, project, nshots, verbatim)
 
+        if use_cache:
+            cache.set(key, job.pid)
+
         logger.info("Job posted on server with pid %s", self.pid)
         return job
 
@@ -128,6 +169,7 @@ class Client:
             headers=self.headers,
             json=payload,
             timeout=constants.TIMEOUT,
+            session=self._session,
         )
         result = response.json()
 
@@ -139,12 +181,95 @@ class Client:
         return QiboJob(
             base_url=self.base_url,
             headers=self.headers,
+            session=self._session,
             pid=self.pid,
             circuit=circuit.raw,
             nshots=nshots,
             device=device,
         )
 
+    def run_circuits(
+        self,
+        circuits: T.List[qibo.Circuit],
+        device: str,
+        project: str = "personal",
+        nshots: T.Optional[int] = None,
+        verbatim: bool = False,
+    ) -> T.List[QiboJob]:
+        """Run a batch of circuits on the cluster with a single request.
+
+        :param circuits: the circuits to run
+        :type circuits: List[Circuit]
+        :param device: the device to run the circuits on.
+        :type device: str
+        :type project: the project to run the circuits on.
+        :type project: str
+        :param nshots: number of shots, mandatory for non-simulation devices, defaults to `nshots=100` for simulation partitions
+        :type nshots: int
+        :param verbatim: If True, attempts to run the circuits without any transpilation. Defaults to False.
+        :type verbatim: bool
+
+        :return: the list of jobs, in the same order as the given circuits
+        :rtype: List[QiboJob]
+        """
+        self.check_client_server_qibo_versions()
+        logger.info("Post %d new circuits on the server", len(circuits))
+        jobs = self._post_circuits(circuits, device, project, nshots, verbatim)
+
+        logger.info(
+            "Jobs posted on server with pids %s", ", ".join(job.pid for job in jobs)
+        )
+        return jobs
+
+    def _post_circuits(
+        self,
+        circuits: T.List[qibo.Circuit],
+        device: str,
+        project: str,
+        nshots: T.Optional[int] = None,
+        verbatim: bool = False,
+    ) -> T.List[QiboJob]:
+        url = self.base_url + "/api/jobs/batch/"
+
+        payload = {
+            "circuits": [circuit.raw for circuit in circuits],
+            "nshots": nshots,
+            "device": device,
+            "project": project,
+            "verbatim": verbatim,
+        }
+        response = QiboApiRequest.post(
+            url,
+            headers=self.headers,
+            json=payload,
+            timeout=constants.TIMEOUT,
+            session=self._session,
+        )
+        result = response.json()
+
+        pids = result.get("pids")
+
+        if pids is None:
+            raise JobPostServerError(result["detail"])
+
+        if len(pids) != len(circuits):
+            raise JobPostServerError(
+                f"Server returned {len(pids)} pids for {len(circuits)} circuits"
+            )
+
+        return [
+            QiboJob(
+                base_url=self.base_url,
+                headers=self.headers,
+                session=self._session,
+                pid=pid,
+                circuit=circuit.raw,
+                nshots=nshots,
+                device=device,
+            )
+            for pid, circuit in zip(pids, circuits)
+        ]
+
     def print_quota_info(self):
         """Logs the formatted user quota info table."""
         url = self.base_url + "/api/disk_quota/"
@@ -153,6 +278,7 @@ class Client:
             url,
             headers=self.headers,
             timeout=constants.TIMEOUT,
+            session=self._session,
         )
 
         disk_quota = response.json()[0]
@@ -163,6 +289,7 @@ class Client:
             url,
             headers=self.headers,
             timeout=constants.TIMEOUT,
+            session=self._session,
         )
 
         projectquotas = response.json()
@@ -210,6 +337,7 @@ class Client:
             url,
             headers=self.headers,
             timeout=constants.TIMEOUT,
+            session=self._session,
         )
 
         def format_date(dt: str) -> str:
@@ -252,7 +380,7 @@ class Client:
         :return: the requested QiboJob object
         :rtype: QiboJob
         """
-        job = QiboJob(base_url=self.base_url, pid=pid)
+        job = QiboJob(base_url=self.base_url, session=self._session, pid=pid)
         job.refresh()
         return job
 
@@ -262,5 +390,5 @@ class Client:
         :param pid: the job's process identifier
         :type pid: str
         """
-        job = QiboJob(base_url=self.base_url, pid=pid)
+        job = QiboJob(base_url=self.base_url, session=self._session, pid=pid)
         return job.delete()
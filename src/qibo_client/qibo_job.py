@@ -1,7 +1,15 @@
+import asyncio
+import functools
+import io
+import platform
+import shutil
+import subprocess
 import tarfile
 import tempfile
+import threading
 import time
 import typing as T
+from concurrent.futures import Executor, ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
 
@@ -10,11 +18,24 @@ import requests
 
 from . import constants
 from .config_logging import logger
-from .utils import QiboApiRequest
+from .utils import QiboApiRequest, new_session
 
+try:
+    import rapidgzip
+except ImportError:
+    rapidgzip = None
 
-def convert_str_to_job_status(status: str):
-    return next((s for s in QiboJobStatus if s.value == status), None)
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# the `data` extraction filter rejects members unsafe to extract, it is
+# available since Python 3.12 and in the security releases of older versions;
+# it covers the `tarfile` paths only, the system `tar` path relies on
+# `_NATIVE_TAR_SAFETY_FLAGS` instead
+_EXTRACTION_FILTER = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
 
 
 class QiboJobStatus(Enum):
@@ -26,49 +47,236 @@ class QiboJobStatus(Enum):
     ERROR = "error"
 
 
-def _write_stream_to_tmp_file(stream: T.Iterable) -> Path:
-    """Write chunk of bytes to temporary file.
+_STATUS_BY_VALUE = {s.value: s for s in QiboJobStatus}
 
-    The tmp_path should be closed manually.
 
-    :param stream: the stream of bytes chunks to be saved on disk
-    :type stream: Iterable
-
-    :return: the name of the tempo
+def convert_str_to_job_status(status: str):
+    return _STATUS_BY_VALUE.get(status)
+
+
+# flags hardening the system `tar` like the `data` filter hardens `tarfile`:
+# files are owned by the current user, their permissions follow the umask and
+# the metadata of already existing directories is left untouched
+_NATIVE_TAR_SAFETY_FLAGS = [
+    "--no-same-owner",
+    "--no-same-permissions",
+    "--no-overwrite-dir",
+]
+
+
+@functools.lru_cache(maxsize=None)
+def _native_tar_available() -> bool:
+    """Check whether the system `tar` is GNU tar, the only implementation
+    supporting all of `_NATIVE_TAR_SAFETY_FLAGS`."""
+    if platform.system() == "Windows" or shutil.which("tar") is None:
+        return False
+    try:
+        version = subprocess.run(
+            ["tar", "--version"], capture_output=True, check=True
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    return b"GNU tar" in version
+
+
+def _extract_via_native_tar(stream: T.BinaryIO, results_folder: Path):
+    """Unpack the archive stream to a given folder with the system `tar`.
+
+    The stream is piped into a `tar` subprocess, so that decompression and
+    extraction run outside of the Python interpreter. GNU tar already refuses
+    members with absolute paths or `..` components, `_NATIVE_TAR_SAFETY_FLAGS`
+    cover ownership and permissions.
+
+    :param stream: the file-like object yielding the gzipped archive bytes
+    :type stream: BinaryIO
+    :param results_folder: the local path to the results folder
+    :type results_folder: Path
 
+    :raises tarfile.ReadError: if `tar` fails to unpack the stream
     """
-    with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-        for chunk in stream:
-            if chunk:
-                tmp_file.write(chunk)
-        archive_path = tmp_file.name
-    return Path(archive_path)
+    with tempfile.TemporaryFile() as stderr:
+        process = subprocess.Popen(
+            ["tar", "-xzf", "-", "-C", str(results_folder), *_NATIVE_TAR_SAFETY_FLAGS],
+            stdin=subprocess.PIPE,
+            stderr=stderr,
+        )
+        try:
+            shutil.copyfileobj(stream, process.stdin, constants.TAR_COPY_BUFSIZE)
+        except BrokenPipeError:
+            # tar exited early, the failure is reported below
+            pass
+        finally:
+            process.stdin.close()
+        returncode = process.wait()
 
+        if returncode != 0:
+            stderr.seek(0)
+            message = stderr.read().decode(errors="replace").strip()
+            raise tarfile.ReadError(f"tar exited with status {returncode}: {message}")
 
-def _extract_archive_to_folder(source_archive: Path, destination_folder: Path):
-    with tarfile.open(source_archive, "r:gz") as archive:
-        archive.extractall(destination_folder)
 
+def _extract_via_rapidgzip(stream: T.BinaryIO, results_folder: Path):
+    """Unpack the seekable archive stream to a given folder with `rapidgzip`.
 
-def _save_and_unpack_stream_response_to_folder(
-    stream: T.Iterable, results_folder: Path
-):
-    """Save the stream to a given folder.
+    The gzip stream is decompressed in parallel chunks by a pool of threads.
 
-    Internally, save the stream to a temporary archive and extract its contents
-    to the target folder.
+    :param stream: the seekable file-like object with the gzipped archive bytes
+    :type stream: BinaryIO
+    :param results_folder: the local path to the results folder
+    :type results_folder: Path
 
-    :param stream: the iterator containing the response content
-    :type stream: Iterable
+    :raises tarfile.ReadError: if the stream is not a valid gzip archive
+    """
+    try:
+        # parallelization=0 uses all the available cores
+        with rapidgzip.RapidgzipFile(
+            stream, parallelization=0, chunk_size=constants.RAPIDGZIP_CHUNK_SIZE
+        ) as decompressed:
+            with tarfile.open(
+                fileobj=decompressed,
+                mode="r|",
+                bufsize=constants.TAR_STREAM_BUFSIZE,
+                copybufsize=constants.TAR_COPY_BUFSIZE,
+            ) as archive:
+                archive.extractall(results_folder, **_EXTRACTION_FILTER)
+    except ValueError as err:
+        raise tarfile.ReadError(str(err)) from err
+
+
+def _extract_via_zstandard(stream: T.BinaryIO, results_folder: Path):
+    """Unpack the zstd-compressed archive stream to a given folder.
+
+    :param stream: the file-like object yielding the zstd-compressed tar bytes
+    :type stream: BinaryIO
     :param results_folder: the local path to the results folder
     :type results_folder: Path
+
+    :raises tarfile.ReadError: if the stream is not a valid zstd archive
     """
-    archive_path = _write_stream_to_tmp_file(stream)
+    if zstandard is None:
+        raise tarfile.ReadError(
+            "Received a zstd-compressed archive, but `zstandard` is not installed"
+        )
 
-    _extract_archive_to_folder(archive_path, results_folder)
+    decompressor = zstandard.ZstdDecompressor(
+        max_window_size=constants.ZSTD_MAX_WINDOW_SIZE
+    )
+    try:
+        with decompressor.stream_reader(stream) as decompressed:
+            with tarfile.open(
+                fileobj=decompressed,
+                mode="r|",
+                bufsize=constants.TAR_STREAM_BUFSIZE,
+                copybufsize=constants.TAR_COPY_BUFSIZE,
+            ) as archive:
+                archive.extractall(results_folder, **_EXTRACTION_FILTER)
+    except zstandard.ZstdError as err:
+        raise tarfile.ReadError(str(err)) from err
+
+
+def _read_stream_to_memory(stream: T.BinaryIO, size: int) -> io.BytesIO:
+    """Read the stream into a buffer preallocated in memory.
+
+    :param stream: the file-like object to read
+    :type stream: BinaryIO
+    :param size: the number of bytes expected from the stream
+    :type size: int
+
+    :return: the in-memory buffer holding the bytes read
+    :rtype: io.BytesIO
+    """
+    buffer = io.BytesIO()
+    if size > 0:
+        # grow the buffer to its final size with a single allocation
+        buffer.seek(size - 1)
+        buffer.write(b"\0")
+
+    position = 0
+    with buffer.getbuffer() as view:
+        while position < size:
+            nbytes = stream.readinto(view[position:])
+            if not nbytes:
+                break
+            position += nbytes
+
+    buffer.truncate(position)
+    buffer.seek(0)
+    return buffer
+
+
+def _extract_seekable_archive(stream: T.BinaryIO, results_folder: Path):
+    """Unpack the seekable archive stream to a given folder.
+
+    :param stream: the seekable file-like object with the gzipped archive bytes
+    :type stream: BinaryIO
+    :param results_folder: the local path to the results folder
+    :type results_folder: Path
+    """
+    with tarfile.open(
+        fileobj=stream, mode="r:gz", copybufsize=constants.TAR_COPY_BUFSIZE
+    ) as archive:
+        archive.extractall(results_folder, **_EXTRACTION_FILTER)
+
+
+def _save_and_unpack_stream_response_to_folder(
+    stream: T.BinaryIO,
+    results_folder: Path,
+    size: T.Optional[int] = None,
+    encoding: T.Optional[str] = None,
+):
+    """Unpack the archive stream to a given folder.
+
+    The archive is never saved to disk. Archives smaller than
+    `constants.IN_MEMORY_ARCHIVE_MAX_SIZE` are downloaded in memory and then
+    unpacked, in parallel by `rapidgzip`, when installed, for the ones of at
+    least `constants.RAPIDGZIP_MIN_SIZE`. Archives larger than
+    `constants.NATIVE_TAR_MIN_SIZE` are unpacked by the system `tar`, when
+    available. Otherwise, the stream is decompressed and extracted on the fly,
+    while it is being downloaded. Archives compressed with zstd, instead of
+    gzip, are always extracted on the fly.
+
+    :param stream: the file-like object yielding the gzipped archive bytes
+    :type stream: BinaryIO
+    :param results_folder: the local path to the results folder
+    :type results_folder: Path
+    :param size: the archive size in bytes, if known
+    :type size: Optional[int]
+    :param encoding: the response content encoding, if any
+    :type encoding: Optional[str]
+    """
+    if encoding == "zstd":
+        _extract_via_zstandard(stream, results_folder)
+        return
+
+    if size is not None and size < constants.IN_MEMORY_ARCHIVE_MAX_SIZE:
+        stream = _read_stream_to_memory(stream, size)
+
+    if stream.seekable():
+        if (
+            rapidgzip is not None
+            and size is not None
+            and size >= constants.RAPIDGZIP_MIN_SIZE
+        ):
+            _extract_via_rapidgzip(stream, results_folder)
+        else:
+            _extract_seekable_archive(stream, results_folder)
+        return
+
+    if (
+        size is not None
+        and size >= constants.NATIVE_TAR_MIN_SIZE
+        and _native_tar_available()
+    ):
+        _extract_via_native_tar(stream, results_folder)
+        return
 
-    # clean up temporary file
-    archive_path.unlink()
+    with tarfile.open(
+        fileobj=stream,
+        mode="r|gz",
+        bufsize=constants.TAR_STREAM_BUFSIZE,
+        copybufsize=constants.TAR_COPY_BUFSIZE,
+    ) as archive:
+        archive.extractall(results_folder, **_EXTRACTION_FILTER)
 
 
 class QiboJob:
@@ -77,18 +285,24 @@ class QiboJob:
         pid: str,
         base_url: str = constants.BASE_URL,
         headers: T.Dict[str, str] = None,
+        session: T.Optional[requests.Session] = None,
         circuit: T.Optional[qibo.Circuit] = None,
         nshots: T.Optional[int] = None,
         device: T.Optional[str] = None,
     ):
         self.base_url = base_url
         self.headers = headers
+        self._session = new_session(headers) if session is None else session
         self.pid = pid
         self.circuit = circuit
         self.nshots = nshots
         self.device = device
 
+        self.results_folder = constants.RESULTS_BASE_FOLDER / self.pid
+        self.results_path = None
+
         self._status = None
+        self._status_ts = None
 
     def refresh(self):
         """Refreshes job information from server.
@@ -100,6 +314,7 @@ class QiboJob:
             url,
             headers=self.headers,
             timeout=constants.TIMEOUT,
+            session=self._session,
             keys_to_check=["circuit", "nshots", "projectquota", "status"],
         )
 
@@ -112,6 +327,7 @@ class QiboJob:
         self.nshots = info.get("nshots")
         self.device = info["projectquota"]["partition"]["name"]
         self._status = convert_str_to_job_status(info["status"])
+        self._status_ts = time.monotonic()
 
     def status(self) -> QiboJobStatus:
         url = self.base_url + f"/api/jobs/{self.pid}/"
@@ -119,55 +335,102 @@ class QiboJob:
             url,
             headers=self.headers,
             timeout=constants.TIMEOUT,
+            session=self._session,
             keys_to_check=["status"],
         )
         status = response.json()["status"]
         self._status = convert_str_to_job_status(status)
+        self._status_ts = time.monotonic()
         return self._status
 
+    def _cached_status(self) -> QiboJobStatus:
+        """Return the job status, querying the server only if the cached one is
+        older than `constants.STATUS_CACHE_TTL` seconds.
+
+        Completed jobs cannot change status, so the server is never queried
+        again for them.
+        """
+        if self._status in [QiboJobStatus.SUCCESS, QiboJobStatus.ERROR]:
+            return self._status
+        if (
+            self._status_ts is not None
+            and time.monotonic() - self._status_ts < constants.STATUS_CACHE_TTL
+        ):
+            return self._status
+        return self.status()
+
     def running(self) -> bool:
-        if self._status is None:
-            self.refresh()
-        return self._status is QiboJobStatus.RUNNING
+        return self._cached_status() is QiboJobStatus.RUNNING
 
     def success(self) -> bool:
-        if self._status is None:
-            self.refresh()
-        return self._status is QiboJobStatus.SUCCESS
+        return self._cached_status() is QiboJobStatus.SUCCESS
 
     def result(
         self, wait: int = 5, verbose: bool = False
     ) -> T.Optional[qibo.result.QuantumState]:
         """Send requests to server checking whether the job is completed.
 
-        This function populates the `Client.results_folder` and
-        `Client.results_path` attributes.
+        This function populates the `QiboJob.results_path` attribute.
 
         :return: the numpy array with the results of the computation.
                  None if the job raised an error.
         :rtype: T.Optional[np.ndarray]
         """
+        return self._result(wait, verbose)
+
+    def _result(
+        self,
+        wait: int = 5,
+        verbose: bool = False,
+        cancelled: T.Optional[threading.Event] = None,
+    ) -> T.Optional[qibo.result.QuantumState]:
+        """Implementation of :meth:`result`, which stops polling the server as
+        soon as `cancelled` is set."""
+        # results have already been downloaded, no need to query the server
+        results_path = self.results_folder / "results.npy"
+        if results_path.is_file():
+            self.results_path = results_path
+            return qibo.result.load_result(self.results_path)
+
         # @TODO: here we can use custom logger levels instead of if statement
-        response, job_status = self._wait_for_response_to_get_request(wait, verbose)
+        response, job_status = self._wait_for_response_to_get_request(
+            wait, verbose, cancelled
+        )
 
-        # create the job results folder
-        self.results_folder = constants.RESULTS_BASE_FOLDER / self.pid
-        self.results_folder.mkdir(parents=True, exist_ok=True)
+        # unpack the archive to a sibling folder, which replaces the job results
+        # folder only once fully extracted, so that a failed extraction is
+        # never mistaken for downloaded results
+        partial_folder = self.results_folder.with_name(f"{self.pid}.partial")
+        shutil.rmtree(partial_folder, ignore_errors=True)
+        partial_folder.mkdir(parents=True)
+
+        content_length = response.headers.get("Content-Length")
+        size = int(content_length) if content_length is not None else None
+        encoding = response.headers.get("Content-Encoding")
 
         # Save the stream to disk
         try:
+            stream = io.BufferedReader(
+                response.raw, buffer_size=constants.RESPONSE_BUFSIZE
+            )
             _save_and_unpack_stream_response_to_folder(
-                response.iter_content(), self.results_folder
+                stream, partial_folder, size, encoding
             )
-        except tarfile.ReadError as err:
+        except (tarfile.ReadError, EOFError) as err:
+            # `EOFError` is raised by `gzip` when the archive is truncated
             logger.error("Catched tarfile ReadError: %s", err)
             logger.error(
                 "The received file is not a valid gzip "
                 "archive, the result might have to be inspected manually. Find "
                 "the file at `%s`",
-                self.results_folder.as_posix(),
+                partial_folder.as_posix(),
             )
             return None
+        finally:
+            response.close()
+
+        shutil.rmtree(self.results_folder, ignore_errors=True)
+        partial_folder.rename(self.results_folder)
 
         if job_status == QiboJobStatus.ERROR:
             out_log_path = self.results_folder / "stdout.log"
@@ -187,13 +450,59 @@ class QiboJob:
         self.results_path = self.results_folder / "results.npy"
         return qibo.result.load_result(self.results_path)
 
+    async def result_async(
+        self,
+        wait: int = 5,
+        verbose: bool = False,
+        executor: T.Optional[Executor] = None,
+    ) -> T.Optional[qibo.result.QuantumState]:
+        """Asynchronous version of :meth:`result`.
+
+        The polling, download and extraction run in a worker thread, so that
+        the event loop can await many jobs concurrently. When the coroutine is
+        cancelled, the worker thread stops polling the server at the next
+        check.
+
+        :param executor: the executor running the worker thread, defaults to the
+                         event loop default executor
+        :type executor: Optional[Executor]
+
+        :return: the numpy array with the results of the computation.
+                 None if the job raised an error.
+        :rtype: T.Optional[np.ndarray]
+        """
+        loop = asyncio.get_running_loop()
+        cancelled = threading.Event()
+        try:
+            return await loop.run_in_executor(
+                executor, self._result, wait, verbose, cancelled
+            )
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
     def _wait_for_response_to_get_request(
-        self, seconds_between_checks: T.Optional[int] = None, verbose: bool = False
+        self,
+        seconds_between_checks: T.Optional[float] = None,
+        verbose: bool = False,
+        cancelled: T.Optional[threading.Event] = None,
     ) -> T.Tuple[requests.Response, QiboJobStatus]:
         """Wait until the server completes the computation and return the response.
 
-        :param url: the endpoint to make the request
-        :type url: str
+        The server is asked to hold each request for up to
+        `seconds_between_checks` seconds, capped below `constants.TIMEOUT`,
+        until the job completes. Once the server has held a request, the next
+        check is sent straight away. Otherwise, between checks, the client
+        sleeps for an interval that grows exponentially from
+        `constants.MIN_SECONDS_BETWEEN_CHECKS` up to `seconds_between_checks`.
+
+        :param seconds_between_checks: the maximum interval between checks
+        :type seconds_between_checks: float
+        :param cancelled: the event stopping the checks when set
+        :type cancelled: Optional[threading.Event]
+
+        :raises asyncio.CancelledError: if `cancelled` is set before the job
+                                        completes
 
         :return: the response of the get request
         :rtype: requests.Response
@@ -211,12 +520,36 @@ class QiboJob:
             logger.info("Please wait until your job is completed...")
 
         url = self.base_url + f"/api/jobs/result/{self.pid}/"
+        # the server must answer before the client read timeout expires
+        server_wait = min(
+            seconds_between_checks,
+            constants.TIMEOUT * constants.LONG_POLL_TIMEOUT_RATIO,
+        )
+        params = {"wait": server_wait}
+        headers = dict(self.headers or {})
+        if zstandard is not None:
+            # let the server choose the compression of the results archive
+            headers["Accept-Encoding"] = "zstd, gzip"
+        delay = min(constants.MIN_SECONDS_BETWEEN_CHECKS, seconds_between_checks)
 
         while True:
             response = QiboApiRequest.get(
-                url, headers=self.headers, timeout=constants.TIMEOUT
+                url,
+                params=params,
+                headers=headers,
+                timeout=constants.TIMEOUT,
+                session=self._session,
+                stream=True,
             )
-            job_status = convert_str_to_job_status(response.headers["Job-Status"])
+            if response.status_code == requests.codes.no_content:
+                # the server waited for the job without seeing it complete, so
+                # it can be asked again straight away
+                job_status = None
+                sleep = 0
+            else:
+                job_status = convert_str_to_job_status(response.headers["Job-Status"])
+                sleep = delay
+                delay = min(delay * constants.BACKOFF_FACTOR, seconds_between_checks)
 
             if verbose and job_status == QiboJobStatus.QUEUEING:
                 logger.info("Job QUEUEING")
@@ -230,11 +563,49 @@ class QiboJob:
                 if verbose:
                     logger.info("Job COMPLETED")
                 return response, job_status
-            time.sleep(seconds_between_checks)
+            response.close()
+            if cancelled is None:
+                time.sleep(sleep)
+            elif cancelled.wait(sleep):
+                raise asyncio.CancelledError(f"Stopped waiting for job {self.pid}")
 
     def delete(self) -> str:
         url = self.base_url + f"/api/jobs/{self.pid}/"
         response = QiboApiRequest.delete(
-            url, headers=self.headers, timeout=constants.TIMEOUT
+            url,
+            headers=self.headers,
+            timeout=constants.TIMEOUT,
+            session=self._session,
         )
         return response.json()["detail"]
+
+
+async def gather_results(
+    jobs: T.Iterable[QiboJob],
+    max_concurrent: int = 16,
+    wait: int = 5,
+    verbose: bool = False,
+) -> T.List[T.Optional[qibo.result.QuantumState]]:
+    """Wait for the results of many jobs concurrently.
+
+    :param jobs: the jobs to retrieve the results of
+    :type jobs: Iterable[QiboJob]
+    :param max_concurrent: the maximum number of jobs polled at the same time
+    :type max_concurrent: int
+
+    :return: the results of the jobs, in the same order as the given jobs
+    :rtype: List[Optional[QuantumState]]
+    """
+    # a dedicated executor, since the default one may have fewer workers than
+    # `max_concurrent`, not waited for, since cancelled jobs stop on their own
+    executor = ThreadPoolExecutor(max_workers=max_concurrent)
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def _result(job: QiboJob) -> T.Optional[qibo.result.QuantumState]:
+        async with semaphore:
+            return await job.result_async(wait, verbose, executor)
+
+    try:
+        return await asyncio.gather(*(_result(job) for job in jobs))
+    finally:
+        executor.shutdown(wait=False)
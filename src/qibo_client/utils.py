@@ -1,6 +1,7 @@
 import typing as T
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .exceptions import JobApiError, MalformedResponseError
 
@@ -43,6 +44,28 @@ def _make_request(request_fn, keys_to_check, *args, **kwargs) -> requests.Respon
     return response
 
 
+def new_session(
+    headers: T.Optional[T.Dict] = None, pool_maxsize: int = 16
+) -> requests.Session:
+    """Create a session keeping alive the connections to the server.
+
+    :param headers: the headers to be sent with every request
+    :type headers: Optional[Dict]
+    :param pool_maxsize: the maximum number of connections kept alive per host
+    :type pool_maxsize: int
+
+    :return: the new session
+    :rtype: requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if headers is not None:
+        session.headers.update(headers)
+    return session
+
+
 class QiboApiRequest:
 
     @staticmethod
@@ -52,14 +75,17 @@ class QiboApiRequest:
         headers: T.Optional[T.Dict] = None,
         timeout: T.Optional[float] = None,
         keys_to_check: T.Optional[T.List[str]] = None,
+        stream: bool = False,
+        session: T.Optional[requests.Session] = None,
     ) -> requests.Response:
         return _make_request(
-            requests.get,
+            requests.get if session is None else session.get,
             keys_to_check,
             endpoint,
             params=params,
             headers=headers,
             timeout=timeout,
+            stream=stream,
         )
 
     @staticmethod
@@ -69,9 +95,10 @@ class QiboApiRequest:
         json: T.Optional[T.Dict] = None,
         timeout: T.Optional[float] = None,
         keys_to_check: T.Optional[T.List[str]] = None,
+        session: T.Optional[requests.Session] = None,
     ) -> requests.Response:
         return _make_request(
-            requests.post,
+            requests.post if session is None else session.post,
             keys_to_check,
             endpoint,
             headers=headers,
@@ -85,7 +112,12 @@ class QiboApiRequest:
         timeout: T.Optional[float] = None,
         headers: T.Optional[T.Dict] = None,
         keys_to_check: T.Optional[T.List[str]] = None,
+        session: T.Optional[requests.Session] = None,
     ) -> requests.Response:
         return _make_request(
-            requests.delete, keys_to_check, endpoint, headers=headers, timeout=timeout
+            requests.delete if session is None else session.delete,
+            keys_to_check,
+            endpoint,
+            headers=headers,
+            timeout=timeout,
         )
@@ -0,0 +1,64 @@
+from pathlib import Path
+
+import pytest
+
+from qibo_client.cache import QiboCircuitCache
+
+FAKE_CIRCUIT = "fakeCircuit"
+FAKE_NSHOTS = 10
+FAKE_DEVICE = "fakeDevice"
+FAKE_PID = "fakePid"
+
+
+@pytest.fixture
+def results_base_folder(monkeypatch, tmp_path: Path) -> Path:
+    monkeypatch.setattr("qibo_client.cache.constants.RESULTS_BASE_FOLDER", tmp_path)
+    return tmp_path
+
+
+def test_key_is_deterministic():
+    key1 = QiboCircuitCache.key(FAKE_CIRCUIT, FAKE_NSHOTS, FAKE_DEVICE)
+    key2 = QiboCircuitCache.key(FAKE_CIRCUIT, FAKE_NSHOTS, FAKE_DEVICE)
+    assert key1 == key2
+
+
+@pytest.mark.parametrize(
+    "circuit, nshots, device, verbatim",
+    [
+        ("otherCircuit", FAKE_NSHOTS, FAKE_DEVICE, False),
+        (FAKE_CIRCUIT, 20, FAKE_DEVICE, False),
+        (FAKE_CIRCUIT, None, FAKE_DEVICE, False),
+        (FAKE_CIRCUIT, FAKE_NSHOTS, "otherDevice", False),
+        (FAKE_CIRCUIT, FAKE_NSHOTS, FAKE_DEVICE, True),
+    ],
+)
+def test_key_depends_on_execution_settings(circuit, nshots, device, verbatim):
+    key = QiboCircuitCache.key(FAKE_CIRCUIT, FAKE_NSHOTS, FAKE_DEVICE)
+    assert QiboCircuitCache.key(circuit, nshots, device, verbatim) != key
+
+
+def test_default_folder(results_base_folder: Path):
+    cache = QiboCircuitCache()
+    assert cache.folder == results_base_folder / "cache"
+
+
+def test_get_with_missing_entry(results_base_folder: Path):
+    cache = QiboCircuitCache()
+    assert cache.get("missingKey") is None
+
+
+def test_get_with_results_not_downloaded(results_base_folder: Path):
+    cache = QiboCircuitCache()
+    cache.set("key", FAKE_PID)
+    assert cache.get("key") is None
+
+
+def test_set_and_get(results_base_folder: Path):
+    results_folder = results_base_folder / FAKE_PID
+    results_folder.mkdir()
+    (results_folder / "results.npy").write_bytes(b"")
+
+    cache = QiboCircuitCache()
+    cache.set("key", FAKE_PID)
+
+    assert cache.get("key") == FAKE_PID
@@ -1,3 +1,4 @@
+import json
 import logging
 
 import fixs
@@ -41,6 +42,7 @@ class TestQiboClient:
     )
     def setup_and_teardown(self, monkeypatch):
         monkeypatch.setattr(f"{MOD}.constants.BASE_URL", FAKE_URL)
+        monkeypatch.setattr(f"{MOD}._checked_qibo_versions", set())
         self.obj = qibo_client.Client(FAKE_TOKEN, FAKE_URL)
         yield
 
@@ -59,6 +61,7 @@ class TestQiboClient:
     def test_init_method(self):
         assert self.obj.token == FAKE_TOKEN
         assert self.obj.base_url == FAKE_URL
+        assert self.obj._session.headers["x-api-token"] == FAKE_TOKEN
 
         assert self.obj.pid is None
         assert self.obj.results_folder is None
@@ -98,6 +101,31 @@ class TestQiboClient:
 
         assert caplog.messages == []
 
+    def test_check_client_server_qibo_versions_is_cached(self, pass_version_check):
+        self.obj.check_client_server_qibo_versions()
+        qibo_client.Client(FAKE_TOKEN, FAKE_URL).check_client_server_qibo_versions()
+
+        assert len(pass_version_check.calls) == 1
+
+    @responses.activate
+    def test_check_client_server_qibo_versions_is_not_cached_on_failure(
+        self, monkeypatch
+    ):
+        monkeypatch.setattr(f"{MOD}.qibo.__version__", FAKE_QIBO_VERSION)
+
+        endpoint = FAKE_URL + "/api/qibo_version/"
+        response_json = {
+            "server_qibo_version": "0.2.9",
+            "minimum_client_qibo_version": "0.2.8",
+        }
+        responses.add(responses.GET, endpoint, status=200, json=response_json)
+
+        for _ in range(2):
+            with pytest.raises(AssertionError):
+                self.obj.check_client_server_qibo_versions()
+
+        assert len(responses.calls) == 2
+
     @responses.activate
     def test_check_client_server_qibo_versions_with_warning(self, monkeypatch, caplog):
         """Tests client logs a warning if the remote qibo version is greater
@@ -153,6 +181,7 @@ class TestQiboClient:
 
         assert job.pid == FAKE_PID
         assert job.base_url == FAKE_URL
+        assert job._session is self.obj._session
         assert job.circuit == "fakeCircuit"
         assert job.nshots == FAKE_NSHOTS
         assert job.device == FAKE_DEVICE
@@ -164,6 +193,101 @@ class TestQiboClient:
         for expected_message in expected_messages:
             assert expected_message in caplog.messages
 
+    def test_run_circuit_with_cache_miss(
+        self, monkeypatch, tmp_path, pass_version_check
+    ):
+        monkeypatch.setattr(f"{MOD}.constants.RESULTS_BASE_FOLDER", tmp_path)
+        endpoint = FAKE_URL + "/api/jobs/"
+        response_json = {"pid": FAKE_PID}
+        pass_version_check.add(responses.POST, endpoint, status=200, json=response_json)
+
+        job = self.obj.run_circuit(
+            FAKE_CIRCUIT, FAKE_DEVICE, FAKE_PROJECT, FAKE_NSHOTS, use_cache=True
+        )
+
+        assert job.pid == FAKE_PID
+        key = qibo_client.QiboCircuitCache.key(
+            FAKE_CIRCUIT.raw, FAKE_NSHOTS, FAKE_DEVICE
+        )
+        assert (tmp_path / "cache" / key).read_text() == FAKE_PID
+
+    @responses.activate
+    def test_run_circuit_with_cache_hit(self, monkeypatch, tmp_path, caplog):
+        caplog.set_level(logging.INFO)
+        monkeypatch.setattr(f"{MOD}.constants.RESULTS_BASE_FOLDER", tmp_path)
+        results_folder = tmp_path / FAKE_PID
+        results_folder.mkdir()
+        (results_folder / "results.npy").write_bytes(b"")
+        cache = qibo_client.QiboCircuitCache()
+        key = cache.key(FAKE_CIRCUIT.raw, FAKE_NSHOTS, FAKE_DEVICE)
+        cache.set(key, FAKE_PID)
+
+        job = self.obj.run_circuit(
+            FAKE_CIRCUIT, FAKE_DEVICE, FAKE_PROJECT, FAKE_NSHOTS, use_cache=True
+        )
+
+        assert len(responses.calls) == 0
+        assert job.pid == FAKE_PID
+        assert job.circuit == "fakeCircuit"
+        assert job.nshots == FAKE_NSHOTS
+        assert job.device == FAKE_DEVICE
+        assert f"Circuit found in cache, reusing job with pid {FAKE_PID}" in (
+            caplog.messages
+        )
+
+    def test_run_circuits_with_job_post_error(self, pass_version_check):
+        endpoint = FAKE_URL + "/api/jobs/batch/"
+        message = "Server failed to post jobs to queue"
+        response_json = {"detail": message}
+        pass_version_check.add(responses.POST, endpoint, status=200, json=response_json)
+
+        with pytest.raises(exceptions.JobPostServerError) as err:
+            self.obj.run_circuits([FAKE_CIRCUIT], FAKE_DEVICE, FAKE_PROJECT)
+
+        assert str(err.value) == message
+
+    def test_run_circuits_with_mismatching_pids(self, pass_version_check):
+        endpoint = FAKE_URL + "/api/jobs/batch/"
+        response_json = {"pids": ["123"]}
+        pass_version_check.add(responses.POST, endpoint, status=200, json=response_json)
+
+        with pytest.raises(exceptions.JobPostServerError) as err:
+            self.obj.run_circuits(
+                [FAKE_CIRCUIT, FAKE_CIRCUIT], FAKE_DEVICE, FAKE_PROJECT
+            )
+
+        assert str(err.value) == "Server returned 1 pids for 2 circuits"
+
+    def test_run_circuits_with_success(
+        self, monkeypatch, tmp_path, pass_version_check, caplog
+    ):
+        caplog.set_level(logging.INFO)
+        monkeypatch.setattr(f"{MOD}.constants.RESULTS_BASE_FOLDER", tmp_path)
+        endpoint = FAKE_URL + "/api/jobs/batch/"
+        pids = ["123", "456"]
+        response_json = {"pids": pids}
+        pass_version_check.add(responses.POST, endpoint, status=200, json=response_json)
+
+        jobs = self.obj.run_circuits(
+            [FAKE_CIRCUIT, FAKE_CIRCUIT], FAKE_DEVICE, FAKE_PROJECT, FAKE_NSHOTS
+        )
+
+        request_json = json.loads(pass_version_check.calls[-1].request.body)
+        assert request_json["circuits"] == ["fakeCircuit", "fakeCircuit"]
+        assert request_json["nshots"] == FAKE_NSHOTS
+        assert request_json["device"] == FAKE_DEVICE
+        assert request_json["project"] == FAKE_PROJECT
+
+        assert [job.pid for job in jobs] == pids
+        for job in jobs:
+            assert job.base_url == FAKE_URL
+            assert job.circuit == "fakeCircuit"
+            assert job.nshots == FAKE_NSHOTS
+            assert job.device == FAKE_DEVICE
+            assert job._status is None
+
+        assert "Jobs posted on server with pids 123, 456" in caplog.messages
+
     @responses.activate
     def test_print_quota_info(self, caplog):
         caplog.set_level(logging.INFO)
@@ -334,11 +458,13 @@ class TestQiboClient:
         expected_result = QiboJob(
             pid=FAKE_PID,
             base_url=FAKE_URL,
+            session=self.obj._session,
             circuit="fakeCircuit",
             nshots=FAKE_NSHOTS,
             device=FAKE_DEVICE,
         )
         expected_result._status = QiboJobStatus.QUEUEING
+        expected_result._status_ts = result._status_ts
         assert vars(result) == vars(expected_result)
 
     @responses.activate
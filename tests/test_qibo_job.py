@@ -1,17 +1,23 @@
+import asyncio
+import gzip
+import io
+import os
 import tarfile
-from contextlib import contextmanager
+import threading
+import time
+import tracemalloc
+import types
 from pathlib import Path
 
 import fixs
 import jsf
 import pytest
+import requests
 import responses
 import utils_test_qibo_client as utils
 
 from qibo_client import QiboJobStatus, exceptions, qibo_job
 
-ARCHIVE_NAME = "file.tar.gz"
-
 
 @pytest.mark.parametrize(
     "status, expected_result",
@@ -31,115 +37,370 @@ def test_convert_str_to_job_status(status, expected_result):
     assert result == expected_result
 
 
-@pytest.fixture
-def archive_path(monkeypatch, tmp_path: Path):
-    archive_path = tmp_path / ARCHIVE_NAME
-
-    @contextmanager
-    def mock_named_tmp(delete: bool = False):
-        io_stream = archive_path.open("wb")
-        try:
-            yield io_stream
-        finally:
-            io_stream.close()
+def test__save_and_unpack_stream_response_to_folder_with_non_archive_input(
+    tmp_path: Path,
+):
+    stream = io.BytesIO(b"test content")
 
-    monkeypatch.setattr(
-        "qibo_client.qibo_job.tempfile.NamedTemporaryFile", mock_named_tmp
-    )
-    return archive_path
+    with pytest.raises(tarfile.ReadError):
+        qibo_job._save_and_unpack_stream_response_to_folder(stream, tmp_path)
 
 
-def test__write_stream_to_tmp_file_with_simple_text_stream(
-    archive_path, tmp_path: Path
-):
+def test__save_and_unpack_stream_response_to_folder(monkeypatch, tmp_path: Path):
     """
     The test contains the following checks:
 
-    - a new temporary file is created to a specific direction
-    - the content of the temporary file contains equals the one given
+    - the archive members are extracted to the results folder
+    - no temporary archive is left on disk
     """
-    stream = [b"line1\n", b"line2\n"]
+    results_base_folder = tmp_path / "results"
+    results_base_folder.mkdir()
+    monkeypatch.setattr(
+        "qibo_client.qibo_job.constants.RESULTS_BASE_FOLDER", results_base_folder
+    )
 
-    assert not archive_path.is_file()
+    stream, members, members_contents = utils.get_in_memory_fake_archive_stream()
 
-    result_path = qibo_job._write_stream_to_tmp_file(stream)
+    qibo_job._save_and_unpack_stream_response_to_folder(stream, results_base_folder)
+
+    result_members = []
+    result_members_contents = []
+    for member_path in sorted(results_base_folder.iterdir()):
+        result_members.append(member_path.name)
+        result_members_contents.append(member_path.read_bytes())
 
-    assert result_path == archive_path
-    assert result_path.is_file()
-    assert result_path.read_bytes() == b"".join(stream)
+    assert result_members == members
+    assert result_members_contents == members_contents
+    assert sorted(tmp_path.iterdir()) == [results_base_folder]
 
 
-def test__write_stream_to_tmp_file_with_archive(archive_path: Path):
-    """
-    The test contains the following checks:
+def test__extract_via_native_tar(tmp_path: Path):
+    if not qibo_job._native_tar_available():
+        pytest.skip("system `tar` not available")
 
-    - a new temporary archive is created to a specific direction
-    - load the archive in memory and check that the members and the contents
-    match with the expected ones
-    """
     stream, members, members_contents = utils.get_in_memory_fake_archive_stream()
 
-    assert not archive_path.is_file()
+    qibo_job._extract_via_native_tar(stream, tmp_path)
+
+    result_members = sorted(p.name for p in tmp_path.iterdir())
+    assert result_members == members
+    for member, member_content in zip(members, members_contents):
+        assert (tmp_path / member).read_bytes() == member_content
+
+
+def test__extract_via_native_tar_passes_safety_flags(monkeypatch, tmp_path: Path):
+    if not qibo_job._native_tar_available():
+        pytest.skip("system `tar` not available")
+
+    calls = []
+    original_popen = qibo_job.subprocess.Popen
+
+    def spy(args, **kwargs):
+        calls.append(args)
+        return original_popen(["cat"], **kwargs)
+
+    monkeypatch.setattr("qibo_client.qibo_job.subprocess.Popen", spy)
+    qibo_job._extract_via_native_tar(io.BytesIO(b""), tmp_path)
+
+    (args,) = calls
+    for flag in ("--no-same-owner", "--no-same-permissions", "--no-overwrite-dir"):
+        assert flag in args
+
+
+def test__extract_via_native_tar_ignores_archive_ownership_and_modes(
+    tmp_path: Path,
+):
+    if not qibo_job._native_tar_available():
+        pytest.skip("system `tar` not available")
 
-    result_path = qibo_job._write_stream_to_tmp_file(stream)
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        folder = tarfile.TarInfo(".")
+        folder.type = tarfile.DIRTYPE
+        folder.mode = 0o777
+        archive.addfile(folder)
+        member = tarfile.TarInfo("results.npy")
+        member.size = 4
+        member.mode = 0o4777
+        member.uid = member.gid = 12345
+        archive.addfile(member, io.BytesIO(b"data"))
+    buffer.seek(0)
+    tmp_path.chmod(0o700)
 
-    assert result_path == archive_path
-    assert result_path.is_file()
+    qibo_job._extract_via_native_tar(buffer, tmp_path)
 
-    with tarfile.open(result_path, "r:gz") as archive:
-        result_members = sorted(archive.getnames())
-        assert result_members == members
-        for member, member_content in zip(members, members_contents):
-            with archive.extractfile(member) as result_member:
-                result_content = result_member.read()
-            assert result_content == member_content
+    assert tmp_path.stat().st_mode & 0o777 == 0o700
+    stat = (tmp_path / "results.npy").stat()
+    assert stat.st_uid == os.getuid()
+    assert not stat.st_mode & 0o4000
 
 
-def test__extract_archive_to_folder_with_non_archive_input(tmp_path):
-    file_path = tmp_path / "file.txt"
-    file_path.write_text("test content")
+def test__extract_via_native_tar_with_non_archive_input(tmp_path: Path):
+    if not qibo_job._native_tar_available():
+        pytest.skip("system `tar` not available")
+
+    stream = io.BytesIO(b"test content")
 
     with pytest.raises(tarfile.ReadError):
-        qibo_job._extract_archive_to_folder(file_path, tmp_path)
+        qibo_job._extract_via_native_tar(stream, tmp_path)
 
 
-def test__extract_archive_to_folder_with_success(monkeypatch, tmp_path: Path):
-    results_base_folder = tmp_path / "results"
-    results_base_folder.mkdir()
-    archive_path = tmp_path / ARCHIVE_NAME
+@pytest.mark.parametrize(
+    "sized, in_memory_max_size, native_tar_available, expected_backend",
+    [
+        (False, 1000, True, "stream"),
+        (True, 1000, True, "memory"),
+        (True, 100, True, "native"),
+        (True, 100, False, "stream"),
+    ],
+)
+def test__save_and_unpack_stream_response_to_folder_backend_selection(
+    monkeypatch,
+    tmp_path: Path,
+    sized,
+    in_memory_max_size,
+    native_tar_available,
+    expected_backend,
+):
+    monkeypatch.setattr("qibo_client.qibo_job.constants.NATIVE_TAR_MIN_SIZE", 100)
     monkeypatch.setattr(
-        "qibo_client.qibo_job.constants.RESULTS_BASE_FOLDER", results_base_folder
+        "qibo_client.qibo_job.constants.IN_MEMORY_ARCHIVE_MAX_SIZE",
+        in_memory_max_size,
     )
-    members, members_contents = utils.create_fake_archive(archive_path)
+    monkeypatch.setattr(
+        "qibo_client.qibo_job._native_tar_available", lambda: native_tar_available
+    )
+    backends = []
+    monkeypatch.setattr(
+        "qibo_client.qibo_job._extract_via_native_tar",
+        lambda *args: backends.append("native"),
+    )
+    extract_seekable_archive = qibo_job._extract_seekable_archive
 
-    qibo_job._extract_archive_to_folder(archive_path, results_base_folder)
+    def spy(*args):
+        backends.append("memory")
+        extract_seekable_archive(*args)
 
-    result_members = []
-    result_members_contents = []
-    for member_path in sorted(results_base_folder.iterdir()):
-        result_members.append(member_path.name)
-        result_members_contents.append(member_path.read_bytes())
+    monkeypatch.setattr("qibo_client.qibo_job._extract_seekable_archive", spy)
 
-    assert result_members == members
-    assert result_members_contents == members_contents
+    stream, members, _ = utils.get_in_memory_fake_archive_stream()
+    size = len(stream.getvalue()) if sized else None
+    monkeypatch.setattr(stream, "seekable", lambda: False)
+    qibo_job._save_and_unpack_stream_response_to_folder(stream, tmp_path, size)
 
+    assert backends == ([] if expected_backend == "stream" else [expected_backend])
+    extracted_members = sorted(p.name for p in tmp_path.iterdir())
+    assert extracted_members == ([] if expected_backend == "native" else members)
 
-def test__save_and_unpack_stream_response_to_folder(monkeypatch, tmp_path: Path):
-    results_base_folder = tmp_path / "results"
-    results_base_folder.mkdir()
-    archive_path = tmp_path / ARCHIVE_NAME
+
+@pytest.mark.parametrize("chunk_size", [7, 1024])
+def test__read_stream_to_memory(chunk_size):
+    data = b"0123456789" * 10
+
+    class ChunkedStream(io.RawIOBase):
+        def __init__(self):
+            self.source = io.BytesIO(data)
+
+        def readinto(self, buffer):
+            chunk = self.source.read(min(len(buffer), chunk_size))
+            buffer[: len(chunk)] = chunk
+            return len(chunk)
+
+    buffer = qibo_job._read_stream_to_memory(ChunkedStream(), len(data))
+
+    assert isinstance(buffer, io.BytesIO)
+    assert buffer.getvalue() == data
+
+
+def test__read_stream_to_memory_with_truncated_stream():
+    buffer = qibo_job._read_stream_to_memory(io.BytesIO(b"short"), 100)
+    assert buffer.getvalue() == b"short"
+
+
+def test__read_stream_to_memory_with_empty_stream():
+    buffer = qibo_job._read_stream_to_memory(io.BytesIO(b""), 0)
+    assert buffer.getvalue() == b""
+
+
+def test__read_stream_to_memory_allocates_once():
+    size = 8 * 1024 * 1024
+    stream = io.BytesIO(bytes(size))
+
+    tracemalloc.start()
+    try:
+        buffer = qibo_job._read_stream_to_memory(stream, size)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert buffer.tell() == 0
+    assert len(buffer.getbuffer()) == size
+    assert peak < 1.25 * size
+
+
+def test__extract_seekable_archive(tmp_path: Path):
+    members = {
+        "results.npy": b"results",
+        "logs/stdout.log": b"stdout",
+        "logs/nested/stderr.log": b"stderr",
+    }
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for folder in ["logs", "empty"]:
+            folder_info = tarfile.TarInfo(folder)
+            folder_info.type = tarfile.DIRTYPE
+            archive.addfile(folder_info)
+        for member, contents in members.items():
+            member_info = tarfile.TarInfo(member)
+            member_info.size = len(contents)
+            archive.addfile(member_info, io.BytesIO(contents))
+    buffer.seek(0)
+
+    qibo_job._extract_seekable_archive(buffer, tmp_path)
+
+    assert (tmp_path / "empty").is_dir()
+    for member, contents in members.items():
+        assert (tmp_path / member).read_bytes() == contents
+
+
+def test__extract_via_zstandard(tmp_path: Path):
+    zstandard = pytest.importorskip("zstandard")
+
+    buffer = io.BytesIO()
+    members = utils._generic_create_archive_(
+        lambda: tarfile.open(fileobj=buffer, mode="w")
+    )[0]
+    stream = io.BytesIO(zstandard.ZstdCompressor().compress(buffer.getvalue()))
+
+    qibo_job._extract_via_zstandard(stream, tmp_path)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == members
+
+
+def test__extract_via_zstandard_without_zstandard(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr("qibo_client.qibo_job.zstandard", None)
+
+    with pytest.raises(tarfile.ReadError):
+        qibo_job._extract_via_zstandard(io.BytesIO(b"test content"), tmp_path)
+
+
+def test__save_and_unpack_stream_response_to_folder_with_zstd(
+    monkeypatch, tmp_path: Path
+):
+    calls = []
     monkeypatch.setattr(
-        "qibo_client.qibo_job.constants.RESULTS_BASE_FOLDER", results_base_folder
+        "qibo_client.qibo_job._extract_via_zstandard",
+        lambda *args: calls.append(args),
     )
+    stream = io.BytesIO(b"test content")
 
-    stream, _, _ = utils.get_in_memory_fake_archive_stream()
+    qibo_job._save_and_unpack_stream_response_to_folder(
+        stream, tmp_path, len(stream.getvalue()), "zstd"
+    )
 
-    assert not archive_path.is_file()
+    assert calls == [(stream, tmp_path)]
+
+
+@pytest.mark.skipif(
+    not hasattr(tarfile, "data_filter"), reason="tarfile filters not available"
+)
+@pytest.mark.parametrize("seekable", [True, False])
+def test__save_and_unpack_stream_response_to_folder_rejects_unsafe_members(
+    monkeypatch, tmp_path: Path, seekable
+):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        member_info = tarfile.TarInfo("../outside.txt")
+        member_info.size = 4
+        archive.addfile(member_info, io.BytesIO(b"evil"))
+    buffer.seek(0)
+    monkeypatch.setattr(buffer, "seekable", lambda: seekable)
+
+    results_folder = tmp_path / "results"
+    results_folder.mkdir()
+
+    with pytest.raises(tarfile.TarError):
+        qibo_job._save_and_unpack_stream_response_to_folder(buffer, results_folder)
+
+    assert not (tmp_path / "outside.txt").exists()
+
+
+@pytest.fixture
+def fake_rapidgzip(monkeypatch):
+    fake_module = types.SimpleNamespace(
+        RapidgzipFile=lambda stream, parallelization, chunk_size: gzip.GzipFile(
+            fileobj=stream
+        )
+    )
+    monkeypatch.setattr("qibo_client.qibo_job.rapidgzip", fake_module)
+    return fake_module
+
+
+def test__extract_via_rapidgzip(fake_rapidgzip, tmp_path: Path):
+    stream, members, members_contents = utils.get_in_memory_fake_archive_stream()
+
+    qibo_job._extract_via_rapidgzip(stream, tmp_path)
+
+    result_members = sorted(p.name for p in tmp_path.iterdir())
+    assert result_members == members
+    for member, member_content in zip(members, members_contents):
+        assert (tmp_path / member).read_bytes() == member_content
 
-    qibo_job._save_and_unpack_stream_response_to_folder(stream, results_base_folder)
 
-    # the archive should have been removed
-    assert not archive_path.is_file()
+def test__extract_via_rapidgzip_with_non_archive_input(fake_rapidgzip, tmp_path):
+    def raise_value_error(*args, **kwargs):
+        raise ValueError("Failed to detect a valid file format.")
+
+    fake_rapidgzip.RapidgzipFile = raise_value_error
+
+    with pytest.raises(tarfile.ReadError):
+        qibo_job._extract_via_rapidgzip(io.BytesIO(b"test content"), tmp_path)
+
+
+@pytest.mark.parametrize(
+    "rapidgzip_min_size_offset, in_memory_max_size_offset, expected_backend",
+    [
+        # small archives keep the stdlib in-memory path
+        (1, 1, "memory"),
+        # larger archives downloaded in memory reach rapidgzip
+        (0, 1, "rapidgzip"),
+        # archives too large for memory are streamed, even with rapidgzip
+        (0, 0, "stream"),
+    ],
+)
+def test__save_and_unpack_stream_response_to_folder_with_rapidgzip(
+    monkeypatch,
+    fake_rapidgzip,
+    tmp_path: Path,
+    rapidgzip_min_size_offset,
+    in_memory_max_size_offset,
+    expected_backend,
+):
+    backends = []
+    for backend, name in [
+        ("rapidgzip", "_extract_via_rapidgzip"),
+        ("memory", "_extract_seekable_archive"),
+    ]:
+        monkeypatch.setattr(
+            f"qibo_client.qibo_job.{name}",
+            lambda *args, backend=backend: backends.append(backend),
+        )
+    stream, _, _ = utils.get_in_memory_fake_archive_stream()
+    size = len(stream.getvalue())
+    monkeypatch.setattr(stream, "seekable", lambda: False)
+    monkeypatch.setattr(
+        "qibo_client.qibo_job.constants.RAPIDGZIP_MIN_SIZE",
+        size + rapidgzip_min_size_offset,
+    )
+    monkeypatch.setattr(
+        "qibo_client.qibo_job.constants.IN_MEMORY_ARCHIVE_MAX_SIZE",
+        size + in_memory_max_size_offset,
+    )
+    monkeypatch.setattr("qibo_client.qibo_job.constants.NATIVE_TAR_MIN_SIZE", size + 1)
+
+    qibo_job._save_and_unpack_stream_response_to_folder(stream, tmp_path, size)
+
+    assert backends == ([] if expected_backend == "stream" else [expected_backend])
 
 
 FAKE_PID = "fakePid"
@@ -158,7 +419,10 @@ FAKE_RESULT = "fakeResult"
 
 class TestQiboJob:
     @pytest.fixture(autouse=True)
-    def setup_and_teardown(self):
+    def setup_and_teardown(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(
+            "qibo_client.qibo_job.constants.RESULTS_BASE_FOLDER", tmp_path
+        )
         self.obj = qibo_job.QiboJob(FAKE_PID, FAKE_URL)
         yield
 
@@ -190,11 +454,16 @@ class TestQiboJob:
 
     def test_init_method(self):
         assert self.obj.pid == FAKE_PID
+        expected_results_folder = qibo_job.constants.RESULTS_BASE_FOLDER / FAKE_PID
+        assert self.obj.results_folder == expected_results_folder
+        assert not self.obj.results_folder.exists()
+        assert self.obj.results_path is None
         assert self.obj.base_url == FAKE_URL
         assert self.obj.circuit is None
         assert self.obj.nshots is None
         assert self.obj.device is None
         assert self.obj._status is None
+        assert self.obj._status_ts is None
 
     def test_refresh_with_success(self, refresh_job):
         assert self.obj.circuit == FAKE_CIRCUIT
@@ -252,6 +521,7 @@ class TestQiboJob:
         self, status: QiboJobStatus, expected_result: bool
     ):
         self.obj._status = status
+        self.obj._status_ts = time.monotonic()
         result = self.obj.running()
         assert result == expected_result
 
@@ -273,8 +543,9 @@ class TestQiboJob:
 
         def change_obj_status_to():
             self.obj._status = status
+            return status
 
-        monkeypatch.setattr(self.obj, "refresh", change_obj_status_to)
+        monkeypatch.setattr(self.obj, "status", change_obj_status_to)
         result = self.obj.running()
         assert result == expected_result
 
@@ -293,6 +564,7 @@ class TestQiboJob:
         self, status: QiboJobStatus, expected_result: bool
     ):
         self.obj._status = status
+        self.obj._status_ts = time.monotonic()
         result = self.obj.success()
         assert result == expected_result
 
@@ -314,11 +586,51 @@ class TestQiboJob:
 
         def change_obj_status_to():
             self.obj._status = status
+            return status
 
-        monkeypatch.setattr(self.obj, "refresh", change_obj_status_to)
+        monkeypatch.setattr(self.obj, "status", change_obj_status_to)
         result = self.obj.success()
         assert result == expected_result
 
+    @pytest.mark.parametrize(
+        "status, expected_calls",
+        [
+            (QiboJobStatus.QUEUEING, 1),
+            (QiboJobStatus.PENDING, 1),
+            (QiboJobStatus.RUNNING, 1),
+            (QiboJobStatus.POSTPROCESSING, 1),
+            (QiboJobStatus.SUCCESS, 0),
+            (QiboJobStatus.ERROR, 0),
+        ],
+    )
+    def test_running_with_stale_cached_results(
+        self, monkeypatch, status: QiboJobStatus, expected_calls: int
+    ):
+        self.obj._status = status
+        self.obj._status_ts = time.monotonic() - 10
+        calls = []
+
+        def fake_status():
+            calls.append(1)
+            self.obj._status_ts = time.monotonic()
+            return self.obj._status
+
+        monkeypatch.setattr(self.obj, "status", fake_status)
+        self.obj.running()
+        self.obj.running()
+
+        assert len(calls) == expected_calls
+
+    @responses.activate
+    def test_status_updates_timestamp(self):
+        endpoint = FAKE_URL + f"/api/jobs/{FAKE_PID}/"
+        responses.add(responses.GET, endpoint, status=200, json={"status": "running"})
+
+        before = time.monotonic()
+        self.obj.status()
+
+        assert self.obj._status_ts >= before
+
     @responses.activate
     def test_result_handles_tarfile_readerror(self, monkeypatch, refresh_job):
         endpoint = FAKE_URL + f"/api/jobs/result/{FAKE_PID}/"
@@ -392,6 +704,109 @@ class TestQiboJob:
         result = self.obj.result()
         assert result == FAKE_RESULT
 
+    @responses.activate
+    def test_result_reads_response_through_buffer(self, monkeypatch, tmp_path):
+        stream, members, _ = utils.get_in_memory_fake_archive_stream()
+        archive = stream.getvalue()
+
+        endpoint = FAKE_URL + f"/api/jobs/result/{FAKE_PID}/"
+        headers = {"Job-Status": "success", "Content-Length": str(len(archive))}
+        responses.add(
+            responses.GET, endpoint, status=200, headers=headers, body=archive
+        )
+
+        info_endpoint = FAKE_URL + f"/api/jobs/{FAKE_PID}/"
+        responses.add(
+            responses.GET,
+            info_endpoint,
+            json={"status": "running"},
+            status=200,
+        )
+
+        calls = []
+        original_fn = qibo_job._save_and_unpack_stream_response_to_folder
+
+        def spy(stream, results_folder, size, encoding):
+            calls.append((stream, size))
+            original_fn(stream, results_folder, size, encoding)
+
+        monkeypatch.setattr(
+            "qibo_client.qibo_job._save_and_unpack_stream_response_to_folder", spy
+        )
+        monkeypatch.setattr(
+            "qibo_client.qibo_job.qibo.result.load_result",
+            lambda x: FAKE_RESULT,
+        )
+        result = self.obj.result()
+
+        assert result == FAKE_RESULT
+        stream, size = calls[0]
+        assert isinstance(stream, io.BufferedReader)
+        assert size == len(archive)
+        extracted_members = sorted(p.name for p in (tmp_path / FAKE_PID).iterdir())
+        assert extracted_members == members
+
+    @responses.activate
+    def test_result_after_failed_extraction(self, monkeypatch, tmp_path):
+        content = os.urandom(64 * 1024)
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+            member = tarfile.TarInfo("results.npy")
+            member.size = len(content)
+            archive.addfile(member, io.BytesIO(content))
+        archive = buffer.getvalue()
+        truncated_archive = archive[: len(archive) // 2]
+
+        endpoint = FAKE_URL + f"/api/jobs/result/{FAKE_PID}/"
+        for body in [truncated_archive, archive]:
+            headers = {"Job-Status": "success", "Content-Length": str(len(body))}
+            responses.add(
+                responses.GET, endpoint, status=200, headers=headers, body=body
+            )
+
+        info_endpoint = FAKE_URL + f"/api/jobs/{FAKE_PID}/"
+        responses.add(
+            responses.GET,
+            info_endpoint,
+            json={"status": "running"},
+            status=200,
+        )
+        monkeypatch.setattr(
+            "qibo_client.qibo_job.qibo.result.load_result", Path.read_bytes
+        )
+
+        assert self.obj.result() is None
+        assert not (tmp_path / FAKE_PID).exists()
+
+        assert self.obj.result() == content
+        assert self.obj.results_path == tmp_path / FAKE_PID / "results.npy"
+        assert not (tmp_path / f"{FAKE_PID}.partial").exists()
+
+    @responses.activate
+    def test_result_with_downloaded_results(self, monkeypatch, tmp_path):
+        results_folder = tmp_path / FAKE_PID
+        results_folder.mkdir()
+        (results_folder / "results.npy").write_bytes(b"")
+
+        monkeypatch.setattr(
+            "qibo_client.qibo_job.qibo.result.load_result",
+            lambda x: FAKE_RESULT,
+        )
+        result = self.obj.result()
+
+        assert result == FAKE_RESULT
+        assert self.obj.results_path == results_folder / "results.npy"
+        assert len(responses.calls) == 0
+
+    def test_result_async(self, monkeypatch):
+        monkeypatch.setattr(
+            self.obj,
+            "_result",
+            lambda wait, verbose, cancelled: (FAKE_RESULT, wait, verbose),
+        )
+        result = asyncio.run(self.obj.result_async(1, True))
+        assert result == (FAKE_RESULT, 1, True)
+
     @pytest.mark.parametrize(
         "status, expected_job_status",
         [
@@ -447,7 +862,7 @@ class TestQiboJob:
         # other calls are to result
         for i in range(failed_attempts + 1):
             r = responses.calls[i + 1].request
-            assert r.url == endpoint
+            assert r.url == endpoint + "?wait=0.0001"
 
         expected_logs = ["Please wait until your job is completed..."]
         assert caplog.messages == expected_logs
@@ -494,6 +909,116 @@ class TestQiboJob:
         ]
         assert caplog.messages == expected_logs
 
+    @responses.activate
+    def test_wait_for_response_to_get_request_with_backoff(self, monkeypatch):
+        monkeypatch.setattr("qibo_client.qibo_job.constants.TIMEOUT", 2)
+        sleeps = []
+        monkeypatch.setattr("qibo_client.qibo_job.time.sleep", sleeps.append)
+
+        info_endpoint = FAKE_URL + f"/api/jobs/{FAKE_PID}/"
+        responses.add(
+            responses.GET,
+            info_endpoint,
+            json={"status": "running"},
+            status=200,
+        )
+
+        failed_attempts = 5
+        endpoint = FAKE_URL + f"/api/jobs/result/{FAKE_PID}/"
+        for _ in range(failed_attempts):
+            responses.add(
+                responses.GET,
+                endpoint,
+                headers={"Job-Status": "running"},
+                status=200,
+            )
+        responses.add(
+            responses.GET, endpoint, headers={"Job-Status": "success"}, status=200
+        )
+
+        _, job_status = self.obj._wait_for_response_to_get_request(0.3)
+
+        assert job_status == QiboJobStatus.SUCCESS
+        assert sleeps == pytest.approx([0.1, 0.18, 0.3, 0.3, 0.3])
+
+    @pytest.mark.parametrize("zstandard_installed", [True, False])
+    @responses.activate
+    def test_wait_for_response_to_get_request_accept_encoding(
+        self, monkeypatch, zstandard_installed
+    ):
+        monkeypatch.setattr(
+            "qibo_client.qibo_job.zstandard",
+            types.SimpleNamespace() if zstandard_installed else None,
+        )
+        self.obj.headers = {"x-api-token": "fakeToken"}
+
+        info_endpoint = FAKE_URL + f"/api/jobs/{FAKE_PID}/"
+        responses.add(
+            responses.GET,
+            info_endpoint,
+            json={"status": "running"},
+            status=200,
+        )
+        endpoint = FAKE_URL + f"/api/jobs/result/{FAKE_PID}/"
+        responses.add(
+            responses.GET, endpoint, headers={"Job-Status": "success"}, status=200
+        )
+
+        self.obj._wait_for_response_to_get_request(1e-4)
+
+        request_headers = responses.calls[-1].request.headers
+        assert request_headers["x-api-token"] == "fakeToken"
+        assert (request_headers["Accept-Encoding"] == "zstd, gzip") == (
+            zstandard_installed
+        )
+
+    @responses.activate
+    def test_wait_for_response_to_get_request_with_long_poll_timeout(self, monkeypatch):
+        monkeypatch.setattr("qibo_client.qibo_job.constants.TIMEOUT", 2)
+        sleeps = []
+        monkeypatch.setattr("qibo_client.qibo_job.time.sleep", sleeps.append)
+
+        info_endpoint = FAKE_URL + f"/api/jobs/{FAKE_PID}/"
+        responses.add(
+            responses.GET,
+            info_endpoint,
+            json={"status": "running"},
+            status=200,
+        )
+
+        endpoint = FAKE_URL + f"/api/jobs/result/{FAKE_PID}/"
+        responses.add(responses.GET, endpoint, status=204)
+        responses.add(
+            responses.GET, endpoint, headers={"Job-Status": "success"}, status=200
+        )
+
+        _, job_status = self.obj._wait_for_response_to_get_request(0.3)
+
+        assert job_status == QiboJobStatus.SUCCESS
+        assert len(responses.calls) == 3
+        # the server already waited, the client asks again straight away
+        assert sleeps == [0]
+
+    @responses.activate
+    def test_wait_for_response_to_get_request_caps_server_wait(self, monkeypatch):
+        monkeypatch.setattr("qibo_client.qibo_job.constants.TIMEOUT", 60)
+
+        info_endpoint = FAKE_URL + f"/api/jobs/{FAKE_PID}/"
+        responses.add(
+            responses.GET,
+            info_endpoint,
+            json={"status": "running"},
+            status=200,
+        )
+        endpoint = FAKE_URL + f"/api/jobs/result/{FAKE_PID}/"
+        responses.add(
+            responses.GET, endpoint, headers={"Job-Status": "success"}, status=200
+        )
+
+        self.obj._wait_for_response_to_get_request(90)
+
+        assert responses.calls[-1].request.url == endpoint + "?wait=54.0"
+
     @responses.activate
     def test_delete(self):
         endpoint = FAKE_URL + f"/api/jobs/{FAKE_PID}/"
@@ -502,3 +1027,78 @@ class TestQiboJob:
 
         response = self.obj.delete()
         assert response == response_json["detail"]
+
+
+def test_gather_results(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr("qibo_client.qibo_job.constants.RESULTS_BASE_FOLDER", tmp_path)
+    # more jobs than the workers of the default executor
+    njobs = 40
+    barrier = threading.Barrier(njobs, timeout=5)
+
+    def fake_result(self, wait, verbose, cancelled):
+        # all jobs must be waiting at the same time to pass the barrier
+        barrier.wait()
+        return self.pid
+
+    monkeypatch.setattr(qibo_job.QiboJob, "_result", fake_result)
+    pids = [f"pid{i}" for i in range(njobs)]
+    jobs = [qibo_job.QiboJob(pid, FAKE_URL) for pid in pids]
+
+    results = asyncio.run(qibo_job.gather_results(jobs, max_concurrent=njobs))
+
+    assert results == pids
+
+
+def test_gather_results_with_max_concurrent(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr("qibo_client.qibo_job.constants.RESULTS_BASE_FOLDER", tmp_path)
+    lock = threading.Lock()
+    running = []
+    max_running = []
+
+    def fake_result(self, wait, verbose, cancelled):
+        with lock:
+            running.append(self.pid)
+            max_running.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.remove(self.pid)
+        return self.pid
+
+    monkeypatch.setattr(qibo_job.QiboJob, "_result", fake_result)
+    pids = [f"pid{i}" for i in range(6)]
+    jobs = [qibo_job.QiboJob(pid, FAKE_URL) for pid in pids]
+
+    results = asyncio.run(qibo_job.gather_results(jobs, max_concurrent=2))
+
+    assert results == pids
+    assert max(max_running) <= 2
+
+
+def test_gather_results_cancellation_stops_polling(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr("qibo_client.qibo_job.constants.RESULTS_BASE_FOLDER", tmp_path)
+    polls = []
+
+    def fake_get(url, **kwargs):
+        polls.append(url)
+        response = requests.Response()
+        response.status_code = requests.codes.no_content
+        response.raw = io.BytesIO()
+        return response
+
+    monkeypatch.setattr(
+        qibo_job.QiboJob, "status", lambda self: qibo_job.QiboJobStatus.RUNNING
+    )
+    monkeypatch.setattr("qibo_client.qibo_job.QiboApiRequest.get", fake_get)
+    jobs = [qibo_job.QiboJob(pid, FAKE_URL) for pid in ["pid1", "pid2"]]
+
+    start = time.monotonic()
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(asyncio.wait_for(qibo_job.gather_results(jobs, wait=0.05), 0.2))
+    elapsed = time.monotonic() - start
+
+    # the jobs never complete, so the loop returns only if polling stopped
+    assert elapsed < 1
+    time.sleep(0.2)
+    npolls = len(polls)
+    time.sleep(0.2)
+    assert len(polls) == npolls
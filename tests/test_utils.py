@@ -89,3 +89,25 @@ def test_post_request_with_404_error():
 
     expected_message = f"\033[91m[{status_code} Error] {message}\033[0m"
     assert str(err.value) == expected_message
+
+
+def test_new_session():
+    headers = {"x-api-token": "fakeToken"}
+    session = utils.new_session(headers, pool_maxsize=4)
+
+    assert session.headers["x-api-token"] == "fakeToken"
+    adapter = session.get_adapter("https://fake.endpoint.com")
+    assert adapter._pool_maxsize == 4
+
+
+@responses.activate
+def test_get_request_with_session():
+    endpoint = "http://fake.endpoint.com/api"
+    response_json = {"detail": "the output"}
+    responses.add(responses.GET, endpoint, json=response_json, status=200)
+
+    session = utils.new_session({"x-api-token": "fakeToken"})
+    response = utils.QiboApiRequest.get(endpoint, session=session)
+
+    assert response.json() == response_json
+    assert responses.calls[0].request.headers["x-api-token"] == "fakeToken"
@@ -1,7 +1,7 @@
 import io
 import tarfile
 from pathlib import Path
-from typing import Generator, List, Tuple
+from typing import List, Tuple
 
 
 def _generic_create_archive_(get_file_context_manager_fn):
@@ -47,17 +47,6 @@ def create_in_memory_fake_archive() -> Tuple[bytes, List[str], List[bytes]]:
     return archive_as_bytes, members, members_contents
 
 
-class DataStreamer:
-    def __init__(self, data: bytes, chunk_size: int = 128):
-        self.data = data
-        self.chunk_size = chunk_size
-        self.size = len(data)
-
-    def __iter__(self) -> Generator[None, bytes, None]:
-        for i in range(0, len(self.data), self.chunk_size):
-            yield self.data[i : i + self.chunk_size]
-
-
-def get_in_memory_fake_archive_stream():
+def get_in_memory_fake_archive_stream() -> Tuple[io.BytesIO, List[str], List[bytes]]:
     archive_as_bytes, members, members_contents = create_in_memory_fake_archive()
-    return DataStreamer(archive_as_bytes), members, members_contents
+    return io.BytesIO(archive_as_bytes), members, members_contents